@@ -60,7 +60,7 @@ class ContactType(ConvertibleEnum):
     PRIVATE = "Private"
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, cache_hash=True)
 class Contact:
     """
     A Digital Contact: group or private
@@ -75,7 +75,7 @@ class Contact:
     )
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, cache_hash=True)
 class Talkgroup(Contact):
 
     timeslot = attr.ib(
@@ -190,7 +190,7 @@ def round_frequency(freq, ndigits=5):
     return round(float(freq), ndigits)
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, cache_hash=True)
 class Channel:
     """Common channel attributes"""
 
@@ -261,7 +261,7 @@ def _tone_converter(value):
     return value.upper()
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, cache_hash=True)
 class AnalogChannel(Channel):
     tone_encode = attr.ib(
         default=None,
@@ -287,7 +287,7 @@ class AnalogChannel(Channel):
     )
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, cache_hash=True)
 class DigitalChannel(Channel):
     # fixed bandwidth for digital
     bandwidth = Bandwidth._125
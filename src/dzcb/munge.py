@@ -5,11 +5,16 @@ import re
 import warnings
 
 
+_TAIL_CODE_RE = re.compile(r"[12]?\s[A-Z]+$")
+
+
 def channel_name(ch_name, max_length):
+    if len(ch_name) <= max_length:
+        return ch_name.strip()
     # Truncate the channel name (try to preserve the tail  characters
     # which are typically TG# and 3-digit Code)
-    tail_code = re.search(r"[12]?\s[A-Z]+$", ch_name)
-    if len(ch_name) > max_length and tail_code:
+    tail_code = _TAIL_CODE_RE.search(ch_name)
+    if tail_code:
         n_tail = len(tail_code.group())
         if max_length > n_tail + 1:
             n_trunc = len(ch_name) - max_length
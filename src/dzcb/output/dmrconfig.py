@@ -4,8 +4,10 @@ dmrconfig output filter
 https://github.com/OpenRTX/dmrconfig
 """
 
+import copy
 import datetime
 import enum
+import functools
 import logging
 import re
 import time
@@ -16,7 +18,6 @@ from typing import (
     Tuple,
     Optional,
     Callable,
-    Union,
     Dict,
     ClassVar,
 )
@@ -37,6 +38,39 @@ from dzcb.model import (
 logger = logging.getLogger(__name__)
 
 
+class _FlattenedValues(dict):
+    """
+    Members that cannot be represented are not stored; looking one up
+    raises the same error as flattening it per row would.
+    """
+
+    def __init__(self, allowed, value):
+        super().__init__()
+        self.allowed = allowed
+        self.value = value
+
+    def __missing__(self, member):
+        return self.value(member.flattened(self.allowed))
+
+
+def flattened_values(
+    enum_type: type, allowed: Dict[Any, str], value: Callable
+) -> Dict[Any, str]:
+    """
+    Map each member of enum_type to value(member.flattened(allowed)).
+
+    Members that cannot be represented on the radio are omitted, and
+    raise the original flattening error when looked up.
+    """
+    values = _FlattenedValues(allowed, value)
+    for member in enum_type:
+        try:
+            values[member] = value(member.flattened(allowed))
+        except (KeyError, ValueError):
+            continue  # raised again by __missing__ if the member is used
+    return values
+
+
 @attr.s(frozen=True)
 class RadioDetail:
     """
@@ -72,6 +106,9 @@ class RadioDetail:
     n_grouplist_contacts = attr.ib(
         default=32, validator=attr.validators.instance_of(int)
     )
+    # output values for every Power and Bandwidth, derived from power and bandwidth
+    power_values = attr.ib(init=False, eq=False, repr=False)
+    bandwidth_values = attr.ib(init=False, eq=False, repr=False)
 
     @power.default
     def _power_default(self):
@@ -86,6 +123,14 @@ class RadioDetail:
     def _bandwidth_default(self):
         return {Bandwidth._125: "12.5", Bandwidth._25: "25"}
 
+    @power_values.default
+    def _power_values_default(self):
+        return flattened_values(Power, self.power, lambda p: self.power[p])
+
+    @bandwidth_values.default
+    def _bandwidth_values_default(self):
+        return flattened_values(Bandwidth, self.bandwidth, lambda b: b.value)
+
     def limit(self, object_type):
         if object_type == "channels":
             return self.nchan
@@ -205,7 +250,7 @@ plus_minus = {
 }
 
 
-Range = Union[int, Tuple[int, int]]
+Range = Tuple[int, int]  # (low, high); a single index is (ix, ix)
 
 
 def items_by_index(
@@ -225,73 +270,58 @@ def items_by_index(
     return ibb
 
 
-def items_to_range_tuples(
-    items_by_index: Dict[Any, int],
-    selected_items: Iterable[Any],
-    key: Optional[Callable] = None,
+def ints_to_range_tuples(
+    selected_indexes: Iterable[int],
     max_index: Optional[int] = None,
     max_count: Optional[int] = None,
 ) -> Sequence[Range]:
     """
-    Return an sequence of indexes and range tuples - (start, enc) of selected_items within all_items
+    Return an sequence of range tuples - (start, end) of consecutive selected_indexes
     """
     count = 0
     selected_ranges = []
-    for selected_index in tuple(
-        items_by_index[key(item) if key else item] for item in selected_items
-    ):
+    low_index = previous_index = None
+    for selected_index in selected_indexes:
         if max_index is not None and selected_index > max_index:
             # index out of range for radio type
             continue
         count += 1
         if count > max_count:
             break
-        if not selected_ranges:
-            selected_ranges.append(selected_index)
-            continue
-        low_index = previous_index = selected_ranges[-1]
-        if isinstance(previous_index, tuple):
-            low_index, previous_index = previous_index  # unpack range
-        if previous_index + 1 == selected_index:
+        if previous_index is not None and previous_index + 1 == selected_index:
             # in range! yee haw
-            selected_ranges[-1] = (low_index, selected_index)
-        else:
-            # skipped some
-            selected_ranges.append(selected_index)
-    # split apart tuples of consecutive numbers
-    exploded_ranges = []
-    for rng in selected_ranges:
-        if isinstance(rng, tuple) and (rng[1] - rng[0]) == 1:
-            exploded_ranges.extend(rng)
-        else:
-            exploded_ranges.append(rng)
-    return tuple(exploded_ranges)
+            previous_index = selected_index
+            continue
+        # skipped some
+        if low_index is not None:
+            _append_range(selected_ranges, low_index, previous_index)
+        low_index = previous_index = selected_index
+    if low_index is not None:
+        _append_range(selected_ranges, low_index, previous_index)
+    return tuple(selected_ranges)
+
+
+def _append_range(ranges: list, low_index: int, high_index: int) -> None:
+    """Append a range tuple; split apart consecutive numbers"""
+    if high_index - low_index == 1:
+        ranges.extend(((low_index, low_index), (high_index, high_index)))
+    else:
+        ranges.append((low_index, high_index))
 
 
 def offset_ranges(ranges: Sequence[Range], offset: int) -> Sequence[Range]:
     """Add offset to all values in ranges"""
-    return tuple(
-        tuple(rv + offset for rv in rng_or_ix)
-        if isinstance(rng_or_ix, tuple)
-        else rng_or_ix + offset
-        for rng_or_ix in ranges
-    )
+    return tuple((low + offset, high + offset) for low, high in ranges)
 
 
 def format_ranges(ranges: Sequence[Range]) -> str:
     return ",".join(
-        "{}-{}".format(*r) if isinstance(r, tuple) else str(r) for r in ranges
+        str(low) if low == high else f"{low}-{high}" for low, high in ranges
     )
 
 
 def ranges_to_total_items(ranges: Sequence[Range]) -> int:
-    total = 0
-    for r in ranges:
-        if isinstance(r, tuple):
-            total += r[1] - r[0] + 1
-        else:
-            total += 1
-    return total
+    return sum(high - low + 1 for low, high in ranges)
 
 
 @attr.s
@@ -303,6 +333,8 @@ class CodeplugIndexLookup:
     grouplist_id = attr.ib(init=False)
     scanlist_id = attr.ib(init=False)
     channel = attr.ib(default=None, init=False)  # set by _channels_filtered
+    # channel type -> (index, channel) tuples, set by _channels_filtered
+    channels_by_type = attr.ib(default=None, init=False)
     _contacts_filtered = attr.ib(init=False)
     _channels_filtered = attr.ib(init=False)
 
@@ -331,6 +363,17 @@ class CodeplugIndexLookup:
                 channels_filtered, self._zone_channel_order()
             )
         self.channel = items_by_index(channels_filtered, offset=self.offset)
+        analog_channels = []
+        digital_channels = []
+        for ix, ch in enumerate(channels_filtered):
+            if isinstance(ch, AnalogChannel):
+                analog_channels.append((ix, ch))
+            elif isinstance(ch, DigitalChannel):
+                digital_channels.append((ix, ch))
+        self.channels_by_type = {
+            AnalogChannel: analog_channels,
+            DigitalChannel: digital_channels,
+        }
         return channels_filtered
 
     @grouplist_id.default
@@ -345,6 +388,16 @@ class CodeplugIndexLookup:
             self.codeplug.scanlists, key=lambda sl: sl._id, offset=self.offset
         )
 
+    def channel_indexes(self, channels):
+        """Lazily yield the index of each channel in channels"""
+        channel = self.channel
+        return (channel[ch] for ch in channels)
+
+    def contact_indexes(self, contacts):
+        """Lazily yield the index of each contact in contacts"""
+        contact = self.contact
+        return (contact[ct.name] for ct in contacts)
+
     def _zone_channel_order(self):
         seen_channels = set()
         zone_channels = []
@@ -367,20 +420,37 @@ class Table:
     radio = attr.ib(default=Radio.D868UV, validator=attr.validators.instance_of(Radio))
     index = attr.ib(validator=attr.validators.instance_of(CodeplugIndexLookup))
     include_docs = attr.ib(default=True, validator=attr.validators.instance_of(bool))
+    _radio_detail = attr.ib(init=False, repr=False)
+    _name_limit = attr.ib(init=False, repr=False)
 
     object_name = ""
     field_names = tuple()
     fmt = ""
+    _header = ""  # set by __init_subclass__
+    _doc_template = ""  # set by __init_subclass__
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._header = cls.fmt.format(*cls.field_names).lstrip()
+        cls._doc_template = (cls.__doc__ or "").rstrip().replace("    #", "#")
 
     @index.default
     def _index_default(self):
         return CodeplugIndexLookup(codeplug=self.codeplug, radio=self.radio, offset=1)
 
+    @_radio_detail.default
+    def _radio_detail_default(self):
+        return self.radio.value
+
+    @_name_limit.default
+    def _name_limit_default(self):
+        return self._radio_detail.name_limit
+
     def docs(self, **replacements):
-        return self.__doc__.rstrip().format(**replacements).replace("    #", "#")
+        return self._doc_template.format(**replacements)
 
     def header(self):
-        return self.fmt.format(**{k: k for k in self.field_names}).lstrip()
+        return self._header
 
     def render(self):
         output = []
@@ -390,24 +460,40 @@ class Table:
         output.extend(self)
         return tuple(output)
 
-    def item_to_dict(self, ix, item):
+    def item_to_row(self, ix, item, *lookups):
         raise NotImplementedError
 
-    def format_row(self, ix, item):
-        item_dict = self.item_to_dict(ix, item)
-        if item_dict:
-            return self.fmt.format(**item_dict)
+    def format_row(self, ix, item, *lookups):
+        row = self.item_to_row(ix, item, *lookups)
+        if row:
+            return self.fmt.format(*row)
 
     def name_munge(self, name):
-        return name[: self.radio.value.name_limit].replace(" ", "_")
+        return name[: self._name_limit].replace(" ", "_")
 
     @classmethod
     def evolve_from(cls, table, **kwargs):
-        tdict = attr.asdict(table, recurse=False)
+        if type(table) is cls:
+            return attr.evolve(table, **kwargs)
+        # copy init attributes shared with the new table type by name
+        init_names = {a.name for a in attr.fields(cls) if a.init}
+        tdict = {
+            a.name.lstrip("_"): getattr(table, a.name)
+            for a in attr.fields(type(table))
+            if a.name in init_names
+        }
         tdict.update(kwargs)
         return cls(**tdict)
 
-    def iter_objects(self, object_list, object_limit=None):
+    def row_lookups(self):
+        """
+        Return index lookups passed positionally to each format_row call.
+
+        Resolved once per table iteration rather than once per row.
+        """
+        return ()
+
+    def iter_objects(self, object_list, object_limit=None, lookups=()):
         for ix, item in enumerate(object_list):
             if object_limit is not None and ix + 1 > object_limit:
                 logger.debug(
@@ -416,7 +502,7 @@ class Table:
                     )
                 )
                 break
-            row = self.format_row(ix + 1, item)
+            row = self.format_row(ix + 1, item, *lookups)
             if row:
                 yield row
 
@@ -424,19 +510,33 @@ class Table:
         if not self.object_name:
             raise NotImplementedError("No object_name specified for {!r}".format(self))
         object_list = getattr(self.codeplug, self.object_name)
-        object_limit = self.radio.value.limit(self.object_name)
-        return self.iter_objects(object_list, object_limit=object_limit)
+        object_limit = self._radio_detail.limit(self.object_name)
+        return self.iter_objects(
+            object_list, object_limit=object_limit, lookups=self.row_lookups()
+        )
 
 
+@attr.s
 class ChannelTable(Table):
     """
     analog/digital shared routine
     """
 
+    _power_values = attr.ib(init=False, repr=False)
+    _bandwidth_values = attr.ib(init=False, repr=False)
+
     model_object_class = None  # either AnalogChannel or DigitalChannel
 
+    @_power_values.default
+    def _power_values_default(self):
+        return self._radio_detail.power_values
+
+    @_bandwidth_values.default
+    def _bandwidth_values_default(self):
+        return self._radio_detail.bandwidth_values
+
     def docs(self):
-        detail = self.radio.value
+        detail = self._radio_detail
         return super().docs(
             channel_limit=f"1-{detail.nchan}",
             name_limit=detail.name_limit,
@@ -444,22 +544,24 @@ class ChannelTable(Table):
             bandwidth=", ".join(b.value for b in detail.bandwidth),
         )
 
+    def row_lookups(self):
+        return (self.index.scanlist_id,)
+
     def __iter__(self):
-        for ix, ch in enumerate(self.index._channels_filtered):
-            if not isinstance(ch, self.model_object_class):
-                continue
-            if ix + 1 > self.radio.value.nchan:
+        lookups = self.row_lookups()
+        for ix, ch in self.index.channels_by_type[self.model_object_class]:
+            if ix + 1 > self._radio_detail.nchan:
                 logger.debug(
                     "Channel table is full, ignoring {} channels".format(
                         len(self.index._channels_filtered) - ix
                     )
                 )
                 break
-            yield self.format_row(ix + 1, ch)
+            yield self.format_row(ix + 1, ch, *lookups)
 
-    def scanlist_ix(self, ch):
-        scanlist_ix = self.index.scanlist_id.get(ch.scanlist, None)
-        if scanlist_ix is None or scanlist_ix <= self.radio.value.nscanl:
+    def scanlist_ix(self, ch, scanlist_index):
+        scanlist_ix = scanlist_index.get(ch.scanlist, None)
+        if scanlist_ix is None or scanlist_ix <= self._radio_detail.nscanl:
             return scanlist_ix
         logger.debug(
             "Ignoring scanlist for channel {}, {} out of range".format(
@@ -502,9 +604,9 @@ class AnalogChannelTable(ChannelTable):
         "TxTone",
         "Width",
     )
-    fmt = "{Analog:^6} {Name:16} {Receive:8} {Transmit:8} {Power:6} {Scan:4} {TOT:3} {RO:2} {Admit:5} {Squelch:7} {RxTone:6} {TxTone:6} {Width}"
+    fmt = "{:^6} {:16} {:8} {:8} {:6} {:4} {:3} {:2} {:5} {:7} {:6} {:6} {}"
 
-    def item_to_dict(self, index, ch):
+    def item_to_row(self, index, ch, scanlist_index):
         def normal_dcs(tone):
             if not tone:
                 return "-"
@@ -512,20 +614,20 @@ class AnalogChannelTable(ChannelTable):
                 return tone + "N"
             return tone
 
-        return dict(
-            Analog=index,
-            Name=self.name_munge(ch.short_name),
-            Receive=ch.frequency,
-            Transmit=ch.transmit_frequency,
-            Power=self.radio.value.power[ch.power.flattened(self.radio.value.power)],
-            Scan=self.scanlist_ix(ch) or "-",
-            TOT=90,  # TODO: how to expose this parameter
-            RO=plus_minus[ch.rx_only],
-            Admit="Free",
-            Squelch="Normal",
-            RxTone=normal_dcs(ch.tone_decode),
-            TxTone=normal_dcs(ch.tone_encode),
-            Width=ch.bandwidth.flattened(self.radio.value.bandwidth).value,
+        return (
+            index,  # Analog
+            self.name_munge(ch.short_name),  # Name
+            ch.frequency,  # Receive
+            ch.transmit_frequency,  # Transmit
+            self._power_values[ch.power],  # Power
+            self.scanlist_ix(ch, scanlist_index) or "-",  # Scan
+            90,  # TOT, TODO: how to expose this parameter
+            plus_minus[ch.rx_only],  # RO
+            "Free",  # Admit
+            "Normal",  # Squelch
+            normal_dcs(ch.tone_decode),  # RxTone
+            normal_dcs(ch.tone_encode),  # TxTone
+            self._bandwidth_values[ch.bandwidth],  # Width
         )
 
 
@@ -563,11 +665,14 @@ class DigitalChannelTable(ChannelTable):
         "RxGL",
         "TxContact",
     )
-    fmt = "{Digital:^7} {Name:16} {Receive:8} {Transmit:8} {Power:6} {Scan:4} {TOT:3} {RO:2} {Admit:5} {Color:5} {Slot:4} {RxGL:4} {TxContact:5}"
+    fmt = "{:^7} {:16} {:8} {:8} {:6} {:4} {:3} {:2} {:5} {:5} {:4} {:4} {:5}"
 
-    def grouplist_ix(self, ch):
-        grouplist_ix = self.index.grouplist_id.get(ch.grouplist, None)
-        if grouplist_ix is None or grouplist_ix <= self.radio.value.nglists:
+    def row_lookups(self):
+        return (self.index.scanlist_id, self.index.grouplist_id, self.index.contact)
+
+    def grouplist_ix(self, ch, grouplist_index):
+        grouplist_ix = grouplist_index.get(ch.grouplist, None)
+        if grouplist_ix is None or grouplist_ix <= self._radio_detail.nglists:
             return grouplist_ix
         logger.debug(
             "Ignoring grouplist for channel {}, {} out of range".format(
@@ -575,10 +680,10 @@ class DigitalChannelTable(ChannelTable):
             )
         )
 
-    def tx_contact(self, ch):
+    def tx_contact(self, ch, contact_index):
         if ch.talkgroup:
-            ct_index = self.index.contact[ch.talkgroup.name]
-            if ct_index <= self.radio.value.ncontacts:
+            ct_index = contact_index[ch.talkgroup.name]
+            if ct_index <= self._radio_detail.ncontacts:
                 return "{index:5}   # {name}".format(
                     index=ct_index,
                     name=ch.talkgroup.name,
@@ -590,21 +695,21 @@ class DigitalChannelTable(ChannelTable):
             )
         return "-"
 
-    def item_to_dict(self, index, ch):
-        return dict(
-            Digital=index,
-            Name=self.name_munge(ch.short_name),
-            Receive=ch.frequency,
-            Transmit=ch.transmit_frequency,
-            Power=self.radio.value.power[ch.power.flattened(self.radio.value.power)],
-            Scan=self.scanlist_ix(ch) or "-",
-            TOT=90,  # TODO: how to expose this parameter
-            RO=plus_minus[ch.rx_only],
-            Admit="Color",
-            Color=ch.color_code,
-            Slot=ch.talkgroup.timeslot.value if ch.talkgroup else 1,
-            RxGL=self.grouplist_ix(ch) or "-",
-            TxContact=self.tx_contact(ch),
+    def item_to_row(self, index, ch, scanlist_index, grouplist_index, contact_index):
+        return (
+            index,  # Digital
+            self.name_munge(ch.short_name),  # Name
+            ch.frequency,  # Receive
+            ch.transmit_frequency,  # Transmit
+            self._power_values[ch.power],  # Power
+            self.scanlist_ix(ch, scanlist_index) or "-",  # Scan
+            90,  # TOT, TODO: how to expose this parameter
+            plus_minus[ch.rx_only],  # RO
+            "Color",  # Admit
+            ch.color_code,  # Color
+            ch.talkgroup.timeslot.value if ch.talkgroup else 1,  # Slot
+            self.grouplist_ix(ch, grouplist_index) or "-",  # RxGL
+            self.tx_contact(ch, contact_index),  # TxContact
         )
 
 
@@ -618,14 +723,13 @@ class ZoneTable(Table):
 
     object_name = "zones"
     field_names = ("Zone", "Name", "Channels")
-    fmt = "{Zone:^6} {Name:16} {Channels}"
-
-    def channels(self, zone, channel_list):
-        ch_index_limit = self.radio.value.nchan
-        ch_max = self.radio.value.n_zone_channels
-        channel_ranges = items_to_range_tuples(
-            self.index.channel,
-            channel_list,
+    fmt = "{:^6} {:16} {}"
+
+    def channels(self, zone, channel_list, channel_indexes):
+        ch_index_limit = self._radio_detail.nchan
+        ch_max = self._radio_detail.n_zone_channels
+        channel_ranges = ints_to_range_tuples(
+            channel_indexes(channel_list),
             max_index=ch_index_limit,
             max_count=ch_max,
         )
@@ -643,32 +747,39 @@ class ZoneTable(Table):
             )
         return channels
 
-    def item_to_dict(self, index, zone, attribute="unique_channels"):
-        channels = self.channels(zone, channel_list=getattr(zone, attribute))
+    def item_to_row(self, index, zone, channel_indexes, attribute="unique_channels"):
+        channels = self.channels(
+            zone, channel_list=getattr(zone, attribute), channel_indexes=channel_indexes
+        )
         if not channels:
             logger.debug("Ignoring empty zone {}".format(zone.name))
             return
-        return dict(
-            Zone=index,
-            Name=self.name_munge(zone.name),
-            Channels=channels,
+        return (
+            index,  # Zone
+            self.name_munge(zone.name),  # Name
+            channels,  # Channels
         )
 
-    def format_row(self, ix, item):
-        zone_dicts = []
-        if self.radio.value.zone_has_ab:
+    def format_row(self, ix, item, channel_indexes):
+        zone_rows = []
+        if self._radio_detail.zone_has_ab:
             for ab in ("a", "b"):
-                zchs = self.item_to_dict(f"{ix}{ab}", item, f"channels_{ab}")
+                zchs = self.item_to_row(
+                    f"{ix}{ab}", item, channel_indexes, f"channels_{ab}"
+                )
                 if zchs:
-                    zone_dicts.append(zchs)
+                    zone_rows.append(zchs)
         else:
-            zchs = self.item_to_dict(ix, item)
+            zchs = self.item_to_row(ix, item, channel_indexes)
             if zchs:
-                zone_dicts.append(zchs)
-        return "\n".join(self.fmt.format(**zone) for zone in zone_dicts)
+                zone_rows.append(zchs)
+        return "\n".join(self.fmt.format(*zone) for zone in zone_rows)
 
     def docs(self):
-        return super().docs(zone_limit=f"1-{self.radio.value.nzones}")
+        return super().docs(zone_limit=f"1-{self._radio_detail.nzones}")
+
+    def row_lookups(self):
+        return (self.index.channel_indexes,)
 
 
 class ScanlistTable(Table):
@@ -684,14 +795,13 @@ class ScanlistTable(Table):
 
     object_name = "scanlists"
     field_names = ("Scanlist", "Name", "PCh1", "PCh2", "TxCh", "Channels")
-    fmt = "{Scanlist:^8} {Name:16} {PCh1:4} {PCh2:4} {TxCh:4} {Channels}"
-
-    def channels(self, scanlist):
-        ch_index_limit = self.radio.value.nchan
-        ch_max = self.radio.value.n_scanlist_channels
-        channel_ranges = items_to_range_tuples(
-            self.index.channel,
-            scanlist.channels,
+    fmt = "{:^8} {:16} {:4} {:4} {:4} {}"
+
+    def channels(self, scanlist, channel_indexes):
+        ch_index_limit = self._radio_detail.nchan
+        ch_max = self._radio_detail.n_scanlist_channels
+        channel_ranges = ints_to_range_tuples(
+            channel_indexes(scanlist.channels),
             max_index=ch_index_limit,
             max_count=ch_max,
         )
@@ -709,22 +819,25 @@ class ScanlistTable(Table):
             )
         return channels
 
-    def item_to_dict(self, index, scanlist):
-        channels = self.channels(scanlist)
+    def item_to_row(self, index, scanlist, channel_indexes):
+        channels = self.channels(scanlist, channel_indexes)
         if not channels:
             logger.debug("Ignoring empty scanlist {}".format(scanlist.name))
             return
-        return dict(
-            Scanlist=index,
-            Name=self.name_munge(scanlist.name),
-            PCh1="Sel",
-            PCh2="-",
-            TxCh="Last",
-            Channels=channels,
+        return (
+            index,  # Scanlist
+            self.name_munge(scanlist.name),  # Name
+            "Sel",  # PCh1
+            "-",  # PCh2
+            "Last",  # TxCh
+            channels,  # Channels
         )
 
     def docs(self):
-        return super().docs(scanlist_limit=f"1-{self.radio.value.nscanl}")
+        return super().docs(scanlist_limit=f"1-{self._radio_detail.nscanl}")
+
+    def row_lookups(self):
+        return (self.index.channel_indexes,)
 
 
 class ContactsTable(Table):
@@ -739,24 +852,24 @@ class ContactsTable(Table):
 
     object_name = "contacts"
     field_names = ("Contact", "Name", "Type", "ID", "RxTone")
-    fmt = "{Contact:^8} {Name:16} {Type:7} {ID:8} {RxTone}"
-
-    def item_to_dict(self, index, contact):
-        return dict(
-            Contact=index,
-            Name=self.name_munge(contact.name),
-            Type=contact.kind.value,
-            ID=contact.dmrid,
-            RxTone="-",
+    fmt = "{:^8} {:16} {:7} {:8} {}"
+
+    def item_to_row(self, index, contact):
+        return (
+            index,  # Contact
+            self.name_munge(contact.name),  # Name
+            contact.kind.value,  # Type
+            contact.dmrid,  # ID
+            "-",  # RxTone
         )
 
     def docs(self):
-        return super().docs(contact_limit=f"1-{self.radio.value.ncontacts}")
+        return super().docs(contact_limit=f"1-{self._radio_detail.ncontacts}")
 
     def __iter__(self):
         return self.iter_objects(
             self.index._contacts_filtered,  # unique by name
-            object_limit=self.radio.value.limit(self.object_name),
+            object_limit=self._radio_detail.limit(self.object_name),
         )
 
 
@@ -770,15 +883,13 @@ class GrouplistTable(Table):
 
     object_name = "grouplists"
     field_names = ("Grouplist", "Name", "Contacts")
-    fmt = "{Grouplist:^10} {Name:16} {Contacts}"
-
-    def contacts(self, grouplist):
-        ct_index_limit = self.radio.value.ncontacts
-        ct_max = self.radio.value.n_grouplist_contacts
-        contact_ranges = items_to_range_tuples(
-            self.index.contact,
-            grouplist.contacts,
-            key=lambda ct: ct.name,
+    fmt = "{:^10} {:16} {}"
+
+    def contacts(self, grouplist, contact_indexes):
+        ct_index_limit = self._radio_detail.ncontacts
+        ct_max = self._radio_detail.n_grouplist_contacts
+        contact_ranges = ints_to_range_tuples(
+            contact_indexes(grouplist.contacts),
             max_index=ct_index_limit,
             max_count=ct_max,
         )
@@ -796,22 +907,25 @@ class GrouplistTable(Table):
             )
         return contacts
 
-    def item_to_dict(self, index, grouplist):
-        contacts = self.contacts(grouplist)
+    def item_to_row(self, index, grouplist, contact_indexes):
+        contacts = self.contacts(grouplist, contact_indexes)
         if not contacts:
             logger.debug("Ignoring empty grouplist {}".format(grouplist.name))
             return
-        return dict(
-            Grouplist=index,
-            Name=self.name_munge(grouplist.name),
-            Contacts=contacts,
+        return (
+            index,  # Grouplist
+            self.name_munge(grouplist.name),  # Name
+            contacts,  # Contacts
         )
 
     def docs(self):
         return super().docs(
-            grouplist_limit=f"1-{self.radio.value.nglists}",
+            grouplist_limit=f"1-{self._radio_detail.nglists}",
         )
 
+    def row_lookups(self):
+        return (self.index.contact_indexes,)
+
 
 class TemplateError(ValueError):
     pass
@@ -879,7 +993,7 @@ class DmrConfigTemplate:
         _, match, ranges = line.partition("!dzcb.ranges:")
         if match:
             return tuple(
-                rng.split("-", maxsplit=1) for rng in ranges.strip().split(",")
+                tuple(rng.split("-", maxsplit=1)) for rng in ranges.strip().split(",")
             )
 
     @staticmethod
@@ -923,6 +1037,20 @@ class DmrConfigTemplate:
         if isinstance(template, cls):
             return template  # already a template, done
 
+        # variables are substituted per call, the parsed template is shared
+        t = copy.copy(cls._parse_template(template))
+        t.header = [cls._replace_variables(line) for line in t.header]
+        t.footer = [cls._replace_variables(line) for line in t.footer]
+        return t
+
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def _parse_template(cls, template):
+        """
+        return the parsed DmrConfigTemplate, without variables substituted
+
+        The result is cached and shared, it must not be modified.
+        """
         consuming_table = dict(
             name=None,
             lines=[],
@@ -947,15 +1075,15 @@ class DmrConfigTemplate:
 
         t = cls()
         for tline in template.splitlines():
-            tline = cls._replace_variables(tline)
             t._parse_directives(tline)
             if cls._version_comment_rex.match(tline):
                 remove_preceding_blank()
                 continue  # strip the version line, if present
+            tline_lower = tline.lower()
             if t.radio is None:
                 t.header.append(tline)
                 t.radio = cls._parse_radio(tline)
-            elif any(l in tline.lower() for l in cls._header_lines):
+            elif any(l in tline_lower for l in cls._header_lines):
                 t.header.append(tline)
             # parse (and remove) tables
             elif cls._table_of_comment_rex.match(tline):
@@ -1034,23 +1162,22 @@ class Dmrconfig_Codeplug:
     def render_template(self):
         if not self.template:
             raise RuntimeError("no template is defined")
-        return "\n".join(
-            tuple(self.template.header)
-            + (
-                ("", self.template.version_comment_line)
-                if self.template.include_version is not False
-                else tuple()
-            )
-            + self.render()
-            + tuple(self.template.footer)
-        )
+        output = list(self.template.header)
+        if self.template.include_version is not False:
+            output.extend(("", self.template.version_comment_line))
+        output.extend(self.render())
+        output.extend(self.template.footer)
+        return "\n".join(output)
 
     def render(self):
-        return (
-            self.analog.render()
-            + self.digital.render()
-            + self.contact.render()
-            + self.grouplist.render()
-            + self.scanlist.render()
-            + self.zone.render()
-        )
+        output = []
+        for table in (
+            self.analog,
+            self.digital,
+            self.contact,
+            self.grouplist,
+            self.scanlist,
+            self.zone,
+        ):
+            output.extend(table.render())
+        return tuple(output)
@@ -82,3 +82,111 @@ def test_dmrconfig_contact_integrity(same_contact_both_timeslots_codeplug, templ
     digital_channels = "\n".join(dmrconfig_cp.digital.render())
     for ch_name in exp_channel_names:
         assert ch_name.replace(" ", "_") in digital_channels
+
+
+@pytest.mark.parametrize(
+    "selected, max_index, max_count, exp_ranges",
+    (
+        ((), None, 10, ()),
+        ((3,), None, 10, ((3, 3),)),
+        ((1, 2), None, 10, ((1, 1), (2, 2))),
+        ((1, 2, 3, 4, 7, 9, 10), None, 10, ((1, 4), (7, 7), (9, 9), (10, 10))),
+        ((5, 4, 5, 6), None, 10, ((5, 5), (4, 6))),
+        ((1, 2, 3, 4, 7, 9, 10), 8, 10, ((1, 4), (7, 7))),
+        ((1, 2, 3, 4, 7, 9, 10), None, 5, ((1, 4), (7, 7))),
+    ),
+)
+def test_ints_to_range_tuples(selected, max_index, max_count, exp_ranges):
+    assert (
+        dzcb.output.dmrconfig.ints_to_range_tuples(
+            iter(selected), max_index=max_index, max_count=max_count
+        )
+        == exp_ranges
+    )
+
+
+def test_index_lookup_ranges(complex_codeplug):
+    index = dzcb.output.dmrconfig.CodeplugIndexLookup(
+        codeplug=complex_codeplug,
+        radio=dzcb.output.dmrconfig.Radio.D868UV,
+        offset=1,
+    )
+    sl_all, sl_a, sl_d = complex_codeplug.scanlists
+    assert tuple(index.channel_indexes(sl_a.channels)) == (1, 2, 3)
+    assert dzcb.output.dmrconfig.ints_to_range_tuples(
+        index.channel_indexes(sl_d.channels), max_count=4
+    ) == ((4, 7),)
+    zn_a_d = complex_codeplug.zones[3]
+    assert dzcb.output.dmrconfig.ints_to_range_tuples(
+        index.channel_indexes(zn_a_d.unique_channels), max_count=16
+    ) == ((1, 6),)
+    gl_all, gl_grp, gl_prv = complex_codeplug.grouplists
+    assert tuple(index.contact_indexes(gl_prv.contacts)) == (4, 5, 6)
+    assert dzcb.output.dmrconfig.ints_to_range_tuples(
+        index.contact_indexes(gl_all.contacts), max_index=5, max_count=32
+    ) == ((1, 5),)
+
+
+def test_format_ranges():
+    ranges = ((1, 4), (7, 7), (9, 9), (10, 10))
+    assert dzcb.output.dmrconfig.format_ranges(ranges) == "1-4,7,9,10"
+    assert dzcb.output.dmrconfig.ranges_to_total_items(ranges) == 7
+    assert dzcb.output.dmrconfig.offset_ranges(ranges, 2) == (
+        (3, 6),
+        (9, 9),
+        (11, 11),
+        (12, 12),
+    )
+
+
+def test_radio_detail_unrepresentable_values():
+    detail = dzcb.output.dmrconfig.RadioDetail(
+        name="Test Radio",
+        power={dzcb.model.Power.HIGH: "High"},
+        bandwidth={dzcb.model.Bandwidth._125: "12.5"},
+    )
+    assert detail.power_values[dzcb.model.Power.TURBO] == "High"
+    assert detail.bandwidth_values[dzcb.model.Bandwidth._125] == "12.5"
+    with pytest.raises(ValueError, match="No known bandwidths"):
+        detail.bandwidth_values[dzcb.model.Bandwidth._25]
+    with pytest.raises(KeyError):
+        detail.power_values[dzcb.model.Power.MED]
+
+
+def test_read_template_cached_copy(monkeypatch):
+    calls = iter(range(1, 100))
+    monkeypatch.setitem(
+        dzcb.output.dmrconfig.DmrConfigTemplate._template_variables,
+        "$DATE",
+        lambda: str(next(calls)),
+    )
+    template_text = "\n".join(
+        (
+            "Radio: TYT MD-380",
+            "# !dzcb.ranges: 144-148,420-450",
+            "Last Programmed Date: $DATE",
+            "",
+            "Intro Line 1: $DATE",
+        )
+    )
+    read_template = dzcb.output.dmrconfig.DmrConfigTemplate.read_template
+
+    t1 = read_template(template_text)
+    assert t1.radio is dzcb.output.dmrconfig.Radio.MD380
+    assert t1.header == ["Radio: TYT MD-380", "Last Programmed Date: 1"]
+    assert t1.footer == ["# !dzcb.ranges: 144-148,420-450", "", "Intro Line 1: 2"]
+    assert t1.ranges == (("144", "148"), ("420", "450"))
+    # ranges are shared with the cached parse, so they must be immutable
+    assert all(isinstance(rng, tuple) for rng in t1.ranges)
+
+    # modifying a returned template must not leak into the cached parse
+    t1.header.append("extra header")
+    t1.footer.clear()
+    t1.radio = dzcb.output.dmrconfig.Radio.UV380
+
+    t2 = read_template(template_text)
+    assert t2.radio is dzcb.output.dmrconfig.Radio.MD380
+    assert t2.ranges == (("144", "148"), ("420", "450"))
+    # variables are substituted again on every call
+    assert t2.header == ["Radio: TYT MD-380", "Last Programmed Date: 3"]
+    assert t2.footer == ["# !dzcb.ranges: 144-148,420-450", "", "Intro Line 1: 4"]
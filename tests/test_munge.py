@@ -0,0 +1,18 @@
+import pytest
+
+import dzcb.munge
+
+
+@pytest.mark.parametrize(
+    "ch_name, max_length, exp_name",
+    (
+        ("Short", 16, "Short"),
+        ("Short ", 16, "Short"),
+        ("Exactly 16 chars", 16, "Exactly 16 chars"),
+        ("Long Talkgroup 2 SEA", 16, "Long Talkgr2 SEA"),
+        ("Long Talkgroup Name", 16, "Long Talkgroup N"),
+        ("Long Talkgroup 2 SEA", 5, "Long"),
+    ),
+)
+def test_channel_name(ch_name, max_length, exp_name):
+    assert dzcb.munge.channel_name(ch_name, max_length) == exp_name